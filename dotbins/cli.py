@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
+from typing import Callable
 
 from rich_argparse import RichHelpFormatter
 
@@ -329,10 +330,20 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> None:  # pragma: no cover
-    """Main function to parse arguments and execute commands."""
+def run(
+    argv: list[str] | None = None,
+    config_loader: Callable[[str | None], Config] | None = None,
+) -> None:
+    """Parse the arguments and execute the command.
+
+    Args:
+        argv: Command line arguments, defaults to ``sys.argv[1:]``.
+        config_loader: Function that loads the `Config` from the ``--config-file`` path,
+            defaults to `Config.from_file` (looked up at call time, so it can be patched).
+
+    """
     parser = create_parser()
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     try:
         if args.command == "get":
@@ -351,7 +362,7 @@ def main() -> None:  # pragma: no cover
             log(f"[yellow]dotbins[/] [bold]v{__version__}[/]")
             return
 
-        config = Config.from_file(args.config_file)
+        config = (config_loader or Config.from_file)(args.config_file)
         if args.tools_dir is not None:  # Override tools directory if specified
             config.tools_dir = Path(args.tools_dir)
 
@@ -397,5 +408,10 @@ def main() -> None:  # pragma: no cover
         sys.exit(1)
 
 
+def main() -> None:  # pragma: no cover
+    """Main function to parse arguments and execute commands."""
+    run()
+
+
 if __name__ == "__main__":
     main()
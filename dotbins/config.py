@@ -25,6 +25,7 @@ from .utils import (
     execute_in_parallel,
     fetch_release_info,
     github_url_to_raw_url,
+    http_session,
     humanize_time_ago,
     log,
     replace_home_in_path,
@@ -32,6 +33,11 @@ from .utils import (
     write_shell_scripts,
 )
 
+try:  # libyaml's C loader is much faster, but not available in every PyYAML build
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
+
 if sys.version_info >= (3, 11):
     from typing import Required
 else:  # pragma: no cover
@@ -244,13 +250,14 @@ class Config:
             verbose,
         )
         download_successes = download_files_in_parallel(download_tasks, github_token, verbose)
-        process_downloaded_files(
-            download_tasks,
-            download_successes,
-            self.manifest,
-            self._update_summary,
-            verbose,
-        )
+        with self.manifest.batch():
+            process_downloaded_files(
+                download_tasks,
+                download_successes,
+                self.manifest,
+                self._update_summary,
+                verbose,
+            )
         self.make_binaries_executable()
 
         # Display the summary
@@ -283,8 +290,8 @@ def _maybe_copy_config_file(
     tools_config_path = tools_dir / "dotbins.yaml"
     if tools_config_path.exists():
         try:
-            cfg1 = yaml.safe_load(config_path.read_text())
-            cfg2 = yaml.safe_load(tools_config_path.read_text())
+            cfg1 = yaml.load(config_path.read_bytes(), Loader=SafeLoader)
+            cfg2 = yaml.load(tools_config_path.read_bytes(), Loader=SafeLoader)
         except Exception:  # pragma: no cover
             return
         is_same = cfg1 == cfg2
@@ -406,17 +413,22 @@ class BinSpec:
 
     def skip_download(self, config: Config, force: bool) -> bool:
         """Check if download should be skipped (binary already exists)."""
+        if force:
+            return False
         tool_info = config.manifest.get_tool_info(
             self.tool_config.tool_name,
             self.platform,
             self.arch,
         )
+        if not tool_info or tool_info["tag"] != self.tag:
+            return False
+        # Only hit the filesystem once the manifest says this tag is installed
         destination_dir = config.bin_dir(self.platform, self.arch)
         all_exist = all(
             _installed_binary_exists(destination_dir, self.platform, binary_name)
             for binary_name in self.tool_config.binary_name
         )
-        if tool_info and tool_info["tag"] == self.tag and all_exist and not force:
+        if all_exist:
             dt = humanize_time_ago(tool_info["updated_at"])
             log(
                 f"[b]{self.tool_config.tool_name} {self.tag}[/] for"
@@ -537,8 +549,7 @@ def config_from_file(config_path: str | Path | None = None) -> Config:
         return Config()
 
     try:
-        with open(path) as f:
-            data: RawConfigDict = yaml.safe_load(f) or {}  # type: ignore[assignment]
+        data: RawConfigDict = yaml.load(path.read_bytes(), Loader=SafeLoader) or {}  # type: ignore[assignment]
     except FileNotFoundError:  # pragma: no cover
         log(f"Configuration file not found: {path}", "warning")
         return Config()
@@ -592,9 +603,9 @@ def config_from_url(config_url: str) -> Config:
 
     config_url = github_url_to_raw_url(config_url)
     try:
-        response = requests.get(config_url, timeout=30)
+        response = http_session().get(config_url, timeout=30)
         response.raise_for_status()
-        yaml_data = yaml.safe_load(response.content)
+        yaml_data = yaml.load(response.content, Loader=SafeLoader)
         return Config.from_dict(yaml_data)
     except requests.RequestException as e:  # pragma: no cover
         log(f"Failed to download configuration: {e}", "error", print_exception=True)
@@ -626,16 +637,17 @@ def _normalize_asset_patterns(  # noqa: PLR0912
 
     # If user gave a single string, apply it to all platform/arch combos
     if isinstance(patterns, str):
-        for platform, arch_list in normalized.items():
-            for arch in arch_list:
-                normalized[platform][arch] = patterns
+        for arch_patterns in normalized.values():
+            for arch in arch_patterns:
+                arch_patterns[arch] = patterns
         return normalized
 
     # If user gave a dict, it might be "platform: pattern" or "platform: {arch: pattern}"
     if isinstance(patterns, dict):
         for platform, p_val in patterns.items():
             # Skip unknown platforms
-            if platform not in normalized:
+            platform_patterns = normalized.get(platform)
+            if platform_patterns is None:
                 log(
                     f"Tool [b]{tool_name}[/]: [b]'asset_patterns'[/] uses unknown platform [b]'{platform}'[/]",
                     "error",
@@ -644,13 +656,13 @@ def _normalize_asset_patterns(  # noqa: PLR0912
 
             # If p_val is a single string, apply to all arch
             if isinstance(p_val, str):
-                for arch in normalized[platform]:
-                    normalized[platform][arch] = p_val
+                for arch in platform_patterns:
+                    platform_patterns[arch] = p_val
             # Otherwise it might be {arch: pattern}
             elif isinstance(p_val, dict):
                 for arch, pattern_str in p_val.items():
-                    if arch in normalized[platform]:
-                        normalized[platform][arch] = pattern_str
+                    if arch in platform_patterns:
+                        platform_patterns[arch] = pattern_str
                     else:
                         log(
                             f"Tool [b]{tool_name}[/]: [b]'asset_patterns'[/] uses unknown arch [b]'{arch}'[/]",
@@ -920,8 +932,9 @@ def _auto_detect_asset(
         defaults["windows_abi"],
         defaults["prefer_appimage"],
     )
-    asset_names = [x["name"] for x in assets]
-    asset_name, candidates, err = detect_fn(asset_names)
+    # Asset names are unique within a GitHub release
+    assets_by_name = {x["name"]: x for x in assets}
+    asset_name, candidates, err = detect_fn(list(assets_by_name))
     if err is not None:
         if err.endswith("matches found"):
             assert candidates is not None
@@ -946,7 +959,7 @@ def _auto_detect_asset(
                 log(f"Found multiple candidates: {candidates}, manually select one", "info", "⁉️")
             log(f"Error detecting asset: {err}", "error")
             return None
-    asset = assets[asset_names.index(asset_name)]
+    asset = assets_by_name[asset_name]
     log(f"Found asset: {asset['name']}", "success")
     return asset
 
@@ -957,8 +970,9 @@ def _find_matching_asset(
 ) -> _AssetDict | None:
     """Find a matching asset for the tool."""
     log(f"Looking for asset with pattern: {asset_pattern}", "info")
+    pattern = re.compile(asset_pattern)
     for asset in assets:
-        if re.search(asset_pattern, asset["name"]):
+        if pattern.search(asset["name"]):
             log(f"Found matching asset: {asset['name']}", "success")
             return asset
     log(f"No asset matching '{asset_pattern}' found in {assets}", "warning")
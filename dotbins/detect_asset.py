@@ -5,7 +5,7 @@ from __future__ import annotations
 import os.path
 import re
 import sys
-from functools import partial
+from functools import cache, lru_cache
 from re import Pattern
 from typing import Callable, Literal, NamedTuple, Optional
 
@@ -73,7 +73,8 @@ os_mapping: dict[str, _OS] = {
 }
 
 # Define Arch constants
-ArchAMD64 = _Arch(name="amd64", regex=re.compile(r"(?i)(x64|amd64|x86(-|_)?64)"))
+# `linux[-_]64` covers e.g., micromamba-linux-64 and app_linux_64
+ArchAMD64 = _Arch(name="amd64", regex=re.compile(r"(?i)(x64|amd64|x86(-|_)?64|linux[-_]64)"))
 # We match i686 with i[3-6]86 because its backwards compatible
 ArchI686 = _Arch(name="i686", regex=re.compile(r"(?i)(x32|amd32|x86(-|_)?32|i?[3-6]86)"))
 ArchArm = _Arch(name="arm", regex=re.compile(r"(?i)(arm32|armv6|arm\b)"))
@@ -91,10 +92,16 @@ arch_mapping: dict[str, _Arch] = {
 }
 
 
+@lru_cache(maxsize=4096)
+def _lower_basename(asset: str) -> str:
+    """Lowercased basename, cached because every asset is checked by several helpers."""
+    return os.path.basename(asset).lower()
+
+
 def _match_os(os_obj: _OS, asset: str) -> bool:
     """Match returns true if the asset name matches the OS."""
     # Special case: .appimage files are always for Linux
-    if os_obj.name == "linux" and os.path.basename(asset).lower().endswith(".appimage"):
+    if os_obj.name == "linux" and _lower_basename(asset).endswith(".appimage"):
         return True
     # Check if the asset name matches the OS regex
     if os_obj.anti is not None and os_obj.anti.search(asset):
@@ -104,20 +111,14 @@ def _match_os(os_obj: _OS, asset: str) -> bool:
 
 def _match_arch(arch: _Arch, asset: str) -> bool:
     """Returns True if the architecture matches the given string."""
-    # First, try standard pattern matching
-    if bool(arch.regex.search(asset)):
-        return True
+    return arch.regex.search(asset) is not None
 
-    # Then, handle special cases for AMD64 architecture
-    if arch.name == "amd64":
-        basename = os.path.basename(asset.lower())
 
-        # For micromamba-linux-64 and similar formats
-        # Match patterns like [prefix]-linux-64, [prefix]_linux_64, etc.
-        if "linux-64" in basename or "linux_64" in basename:
-            return True
+# Signature, checksum and other metadata files that are never the binary
+_IGNORED_EXTENSIONS = (".sig", ".sha256", ".sha256sum", ".sbom", ".pem")
 
-    return False
+# Known package formats to deprioritize (lowest priority)
+_PACKAGE_EXTENSIONS = (".deb", ".rpm", ".apk", ".pkg")
 
 
 def detect_single_asset(asset: str, anti: bool = False) -> DetectFunc:
@@ -126,11 +127,11 @@ def detect_single_asset(asset: str, anti: bool = False) -> DetectFunc:
     def detector(assets: Assets) -> DetectResult:
         candidates = []
         for a in assets:
-            if not anti and os.path.basename(a) == asset:
+            basename = os.path.basename(a)
+            if not anti and basename == asset:
                 return a, None, None
-            if not anti and asset in os.path.basename(a):
-                candidates.append(a)
-            if anti and asset not in os.path.basename(a):
+            # Substring match, or no match in anti mode
+            if (asset in basename) is not anti:
                 candidates.append(a)
 
         if len(candidates) == 1:
@@ -172,18 +173,12 @@ def _prioritize_assets(
     package_formats = []
     others = []
 
-    # Known package formats to deprioritize (lowest priority)
-    package_exts = {".deb", ".rpm", ".apk", ".pkg"}
-
-    # These extensions should be ignored when considering if a file is an archive
-    ignored_exts = {".sig", ".sha256", ".sha256sum", ".sbom", ".pem"}
-
     for asset in assets:
         basename = os.path.basename(asset)
-        lower_basename = basename.lower()
+        lower_basename = _lower_basename(asset)
 
         # Skip signature, checksum files, and other metadata
-        if any(lower_basename.endswith(ext) for ext in ignored_exts):
+        if lower_basename.endswith(_IGNORED_EXTENSIONS):
             continue
 
         # Check if it's a Linux AppImage (highest priority for Linux)
@@ -200,12 +195,12 @@ def _prioritize_assets(
             continue
 
         # Check if it's an archive format (high priority)
-        if any(lower_basename.endswith(ext) for ext in SUPPORTED_ARCHIVE_EXTENSIONS):
+        if lower_basename.endswith(SUPPORTED_ARCHIVE_EXTENSIONS):
             archives.append(asset)
             continue
 
         # Check if it's a package format (lowest priority)
-        if any(lower_basename.endswith(ext) for ext in package_exts):
+        if lower_basename.endswith(_PACKAGE_EXTENSIONS):
             package_formats.append(asset)
             continue
 
@@ -254,14 +249,15 @@ def _msvc_or_gnu(assets_list: Assets, windows_abi: Literal["msvc", "gnu"]) -> As
 
 def _sort_arch(assets_list: Assets) -> Assets:
     def arch_priority(asset: str) -> tuple[int, str]:
+        lower = _lower_basename(asset)
         # Prefer i686 (newer) over i386 (older)
-        if "i686" in asset.lower():
+        if "i686" in lower:
             return 0, asset
-        if "i586" in asset.lower():
+        if "i586" in lower:
             return 1, asset
-        if "i486" in asset.lower():
+        if "i486" in lower:
             return 2, asset
-        if "i386" in asset.lower():
+        if "i386" in lower:
             return 3, asset
         return 100, asset  # Other architectures, don't change their order
 
@@ -269,15 +265,15 @@ def _sort_arch(assets_list: Assets) -> Assets:
 
 
 def _is_msvc(asset: str) -> bool:
-    return "msvc" in os.path.basename(asset).lower()
+    return "msvc" in _lower_basename(asset)
 
 
 def _is_musl(asset: str) -> bool:
-    return "musl" in os.path.basename(asset).lower()
+    return "musl" in _lower_basename(asset)
 
 
 def _is_gnu(asset: str) -> bool:
-    return "gnu" in os.path.basename(asset).lower()
+    return "gnu" in _lower_basename(asset)
 
 
 def _detect_system(
@@ -290,32 +286,23 @@ def _detect_system(
     """Returns a function that detects based on OS and architecture."""
 
     def detector(assets: Assets) -> DetectResult:
-        full_matches = []  # OS+Arch matches
-        os_matches = []  # OS matches
-        all_assets = []  # all assets
+        # Skip metadata files before running any of the regexes on them
+        candidates = [a for a in assets if not _lower_basename(a).endswith(_IGNORED_EXTENSIONS)]
 
-        for a in assets:
-            if a.endswith((".sha256", ".sha256sum")):
-                continue
-            os_match = _match_os(os_obj, a)
-            arch_match = _match_arch(arch, a)
-            if os_match and arch_match:
-                full_matches.append(a)
-            if os_match:
-                os_matches.append(a)
-            all_assets.append(a)
-
-        # Apply prioritization (in case multiple matches are found)
-        prio = partial(
-            _prioritize_assets,
+        # Apply prioritization (in case multiple matches are found) once, the
+        # prioritization is stable so the subsets below keep the same order
+        all_assets = _prioritize_assets(
+            candidates,
             os_name=os_obj.name,
             libc_preference=libc_preference,
             windows_abi=windows_abi,
             prefer_appimage=prefer_appimage,
         )
-        os_matches = prio(os_matches)
-        full_matches = prio(full_matches)
-        all_assets = prio(all_assets)
+        if len(all_assets) == 1:  # A single candidate is returned whether it matches or not
+            return all_assets[0], None, None
+
+        os_matches = [a for a in all_assets if _match_os(os_obj, a)]
+        full_matches = [a for a in os_matches if _match_arch(arch, a)]
 
         if len(full_matches) == 1:
             return full_matches[0], None, None
@@ -326,14 +313,13 @@ def _detect_system(
             return os_matches[0], None, None
         if len(os_matches) > 1:  # No arch match, but OS matches
             return ("", os_matches, f"{len(os_matches)} candidates found (unsure architecture)")
-        if len(all_assets) == 1:  # No OS or arch match, but there is a single candidate
-            return all_assets[0], None, None
 
         return "", all_assets, "no candidates found"
 
     return detector
 
 
+@cache
 def create_system_detector(
     os_name: str,
     arch_name: str,
@@ -341,7 +327,11 @@ def create_system_detector(
     windows_abi: Literal["msvc", "gnu"] = "msvc",
     prefer_appimage: bool = True,
 ) -> DetectFunc:
-    """Create a OS detector function for a given OS and architecture."""
+    """Create a OS detector function for a given OS and architecture.
+
+    The detector is stateless, so it is cached and shared between all tools
+    that target the same platform.
+    """
     if os_name not in os_mapping:
         msg = f"unsupported target OS: {os_name}"
         raise ValueError(msg)
@@ -134,4 +134,4 @@ def auto_detect_paths_in_archive(extracted_dir: Path, binary_names: list[str]) -
 
 def auto_detect_extract_archive(name: str) -> bool:
     """Automatically detect if a binary should be extracted from an archive."""
-    return any(name.lower().endswith(ext) for ext in SUPPORTED_ARCHIVE_EXTENSIONS)
+    return name.lower().endswith(SUPPORTED_ARCHIVE_EXTENSIONS)
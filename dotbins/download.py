@@ -38,7 +38,11 @@ def _extract_binary_from_archive(
 
     try:
         extract_archive(archive_path, temp_dir)
-        log(f"Archive extracted to {temp_dir}", "success", "📦")
+        log(
+            f"Archive of [b]{bin_spec.tool_config.tool_name}[/] extracted to {temp_dir}",
+            "success",
+            "📦",
+        )
         _log_extracted_files(temp_dir)
         paths_in_archive = _detect_paths_in_archive(temp_dir, bin_spec.tool_config)
         _process_binaries(temp_dir, destination_dir, paths_in_archive, bin_spec)
@@ -331,28 +335,23 @@ def download_files_in_parallel(
     return execute_in_parallel(download_tasks, func, 16)
 
 
-def _process_downloaded_task(
-    task: _DownloadTask,
-    success: bool,
-    manifest: Manifest,
-    summary: UpdateSummary,
-    verbose: bool,
-) -> bool:
-    """Process a downloaded file."""
-    if not success:
-        summary.add_failed_tool(
-            task.tool_name,
-            task.platform,
-            task.arch,
-            task.tag,
-            reason="Download failed",
-        )
-        return False
+def _install_downloaded_task(task: _DownloadTask, verbose: bool) -> tuple[str | None, str]:
+    """Hash a downloaded file and install its binaries into the destination directory.
+
+    It does not touch the manifest or the update summary; the caller records the outcome.
+
+    Returns:
+        The SHA256 hash of the download (``None`` on failure) and the failure reason.
 
+    """
     try:
         # Calculate SHA256 hash before extraction
         sha256_hash = calculate_sha256(task.temp_path)
-        log(f"SHA256: {sha256_hash}", "info", "🔐")
+        log(
+            f"SHA256 of [b]{task.tool_name}[/] for [b]{task.platform}/{task.arch}[/]: {sha256_hash}",
+            "info",
+            "🔐",
+        )
 
         task.destination_dir.mkdir(parents=True, exist_ok=True)
         extract_archive = task.tool_config.extract_archive
@@ -378,14 +377,7 @@ def _process_downloaded_task(
                     f"Expected exactly one binary name for {task.tool_name}, got {len(binary_names)}",
                     "error",
                 )
-                summary.add_failed_tool(
-                    task.tool_name,
-                    task.platform,
-                    task.arch,
-                    task.tag,
-                    reason="Expected exactly one binary name",
-                )
-                return False
+                return None, "Expected exactly one binary name"
             binary_name = binary_names[0]
             _copy_binary_to_destination(task.temp_path, task.destination_dir, binary_name)
     except Exception as e:
@@ -396,39 +388,53 @@ def _process_downloaded_task(
         elif isinstance(e, FileNotFoundError):
             error_prefix = "Binary not found"
         log(f"Error processing {task.tool_name}: {e!s}", "error", print_exception=verbose)
+        return None, f"{error_prefix}: {e!s}"
+    else:
+        return sha256_hash, ""
+    finally:
+        if task.temp_path.exists():
+            task.temp_path.unlink()
+
+
+def _process_downloaded_task(
+    task: _DownloadTask,
+    sha256_hash: str | None,
+    reason: str,
+    manifest: Manifest,
+    summary: UpdateSummary,
+) -> bool:
+    """Record the outcome of a processed download in the summary and manifest."""
+    if sha256_hash is None:
         summary.add_failed_tool(
             task.tool_name,
             task.platform,
             task.arch,
             task.tag,
-            reason=f"{error_prefix}: {e!s}",
+            reason=reason,
         )
         return False
-    else:
-        summary.add_updated_tool(
-            task.tool_name,
-            task.platform,
-            task.arch,
-            task.tag,
-            old_tag=manifest.get_tool_tag(task.tool_name, task.platform, task.arch) or "—",
-        )
-        manifest.update_tool_info(
-            tool=task.tool_name,
-            platform=task.platform,
-            arch=task.arch,
-            tag=task.tag,
-            sha256=sha256_hash,
-            url=task.asset_url,
-        )
 
-        log(
-            f"Successfully installed [b]{task.tool_name} {task.tag}[/] for [b]{task.platform}/{task.arch}[/]",
-            "success",
-        )
-        return True
-    finally:
-        if task.temp_path.exists():
-            task.temp_path.unlink()
+    summary.add_updated_tool(
+        task.tool_name,
+        task.platform,
+        task.arch,
+        task.tag,
+        old_tag=manifest.get_tool_tag(task.tool_name, task.platform, task.arch) or "—",
+    )
+    manifest.update_tool_info(
+        tool=task.tool_name,
+        platform=task.platform,
+        arch=task.arch,
+        tag=task.tag,
+        sha256=sha256_hash,
+        url=task.asset_url,
+    )
+
+    log(
+        f"Successfully installed [b]{task.tool_name} {task.tag}[/] for [b]{task.platform}/{task.arch}[/]",
+        "success",
+    )
+    return True
 
 
 def process_downloaded_files(
@@ -442,8 +448,13 @@ def process_downloaded_files(
     if not download_successes:
         return
     log(f"Processing {len(download_successes)} downloaded tools...", "info", "🔄")
+    # Extract one tool at a time, so the log lines of different tools are not interleaved
     for task, download_success in zip(download_tasks, download_successes):
-        _process_downloaded_task(task, download_success, manifest, summary, verbose)
+        if download_success:
+            sha256_hash, reason = _install_downloaded_task(task, verbose)
+        else:
+            sha256_hash, reason = None, "Download failed"
+        _process_downloaded_task(task, sha256_hash, reason, manifest, summary)
 
 
 def _determine_architectures(
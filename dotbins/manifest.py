@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import json
+import os
+import shutil
 from collections import defaultdict
+from contextlib import contextmanager, suppress
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, NamedTuple
 
 from rich.console import Console
@@ -13,20 +17,41 @@ from rich.table import Table
 from .utils import humanize_time_ago, log, tag_to_version
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from pathlib import Path
 
     from .config import Config
 
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 MANIFEST_VERSION = 2
 
 
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Deserialize JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class _Spec(NamedTuple):
     name: str
     platform: str
     architecture: str
 
     @classmethod
+    @lru_cache(maxsize=1024)  # The same few keys are split again on every status print
     def from_key(cls, key: str) -> _Spec:
         """Create a _Spec from a key."""
         return cls(*key.split("/"))
@@ -48,27 +73,56 @@ class Manifest:
         """Initialize the Manifest."""
         self.manifest_file = tools_dir / "manifest.json"
         self.data = self._load()
+        self._batch_depth = 0
+        self._unsaved = False
 
     def _load(self) -> dict[str, Any]:
         """Load version data from JSON file."""
         self._maybe_convert_legacy_manifest()
-        if not self.manifest_file.exists():
-            return {"version": MANIFEST_VERSION}
+        # A missing file raises OSError, invalid JSON a ValueError (also with orjson)
         try:
-            with self.manifest_file.open() as f:
-                data = json.load(f)
-        except (OSError, json.JSONDecodeError):
+            return _loads(self.manifest_file.read_bytes())
+        except (OSError, ValueError):
             return {"version": MANIFEST_VERSION}
-        return data
 
     def save(self) -> None:
-        """Save manifest to JSON file."""
-        self.manifest_file.parent.mkdir(parents=True, exist_ok=True)
-        with self.manifest_file.open("w", encoding="utf-8") as f:
-            sorted_data = dict(sorted(self.data.items()))
-            sorted_data.pop("version", None)
-            sorted_data = {"version": MANIFEST_VERSION, **sorted_data}
-            json.dump(sorted_data, f, indent=2)
+        """Save manifest to JSON file.
+
+        The data is written to a temporary file that is flushed to disk and then
+        replaces the manifest, so an interrupted save (or a crash right after it)
+        never leaves a truncated manifest behind. A symlinked manifest (e.g., managed
+        with stow) is written through, so the link itself is kept.
+        """
+        target = self.manifest_file.resolve()
+        target.parent.mkdir(parents=True, exist_ok=True)
+        sorted_data = dict(sorted(self.data.items()))
+        sorted_data.pop("version", None)
+        sorted_data = {"version": MANIFEST_VERSION, **sorted_data}
+        payload = _dumps(sorted_data)
+        tmp_file = target.with_name(f".{target.name}.tmp")
+        try:
+            with tmp_file.open("wb") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            with suppress(FileNotFoundError):  # Keep the permissions of an existing manifest
+                shutil.copymode(target, tmp_file)
+            os.replace(tmp_file, target)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defer saving until the block exits, so many updates write the file only once."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._unsaved:
+                self.save()
+                self._unsaved = False
 
     def get_tool_info(self, tool: str, platform: str, arch: str) -> dict[str, Any] | None:
         """Get version info for a specific tool/platform/arch combination."""
@@ -123,7 +177,10 @@ class Manifest:
             "sha256": sha256,
             "url": url,
         }
-        self.save()
+        if self._batch_depth:
+            self._unsaved = True
+        else:
+            self.save()
 
     def _print_full(self, platform: str | None = None, architecture: str | None = None) -> None:
         """Show versions of installed tools in a formatted table.
@@ -247,7 +304,7 @@ class Manifest:
             self._print_full(platform, architecture)
 
         expected_tools = _expected_tools(config, platform, architecture)
-        installed_tools = _installed_tools(self.data, platform, architecture)
+        installed_tools = set(_installed_tools(self.data, platform, architecture))
         missing_tools = [tool for tool in expected_tools if tool not in installed_tools]
 
         if missing_tools:
@@ -285,7 +342,7 @@ class Manifest:
                 " This might result in some tools being re-downloaded!",
                 "warning",
             )
-            data = json.load(legacy_file.open())
+            data = _loads(legacy_file.read_bytes())
             # "version" field was changed to "tag" (which includes the 'v' prefix)
             for key, value in data.items():
                 data[key] = {
@@ -305,12 +362,12 @@ def _filter_tools(
     architecture: str | None = None,
 ) -> list[_Spec]:
     """Filter tools based on platform and architecture."""
-    return [
-        spec
-        for spec in tools
-        if (spec.platform == platform or platform is None)
-        and (spec.architecture == architecture or architecture is None)
-    ]
+    # Only filter on what is given, instead of checking for None on every row
+    if platform is not None:
+        tools = [spec for spec in tools if spec.platform == platform]
+    if architecture is not None:
+        tools = [spec for spec in tools if spec.architecture == architecture]
+    return tools
 
 
 def _expected_tools(
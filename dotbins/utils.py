@@ -14,6 +14,7 @@ import shutil
 import sys
 import tarfile
 import textwrap
+import threading
 import time
 import zipfile
 from concurrent.futures import ThreadPoolExecutor
@@ -29,7 +30,8 @@ if TYPE_CHECKING:
 
 console = Console()
 
-SUPPORTED_ARCHIVE_EXTENSIONS = [
+# A tuple, so it can be passed to `str.endswith` directly
+SUPPORTED_ARCHIVE_EXTENSIONS = (
     ".zip",
     ".tar",
     ".tar.gz",
@@ -42,17 +44,52 @@ SUPPORTED_ARCHIVE_EXTENSIONS = [
     ".bz2",
     ".xz",
     ".lzma",
-]
+)
 
 SUPPORTED_SHELLS = ["bash", "zsh", "fish", "nushell", "powershell"]
 
+# Read buffer for tar archives (512 tar blocks instead of the default 8 KiB)
+_TAR_BUFSIZE = 256 * 1024
+
+# Chunk size for streaming single-file (.gz, .bz2, .xz) decompression
+_COPY_BUFSIZE = 1 << 20
+
 Shells = Literal["bash", "zsh", "fish", "nushell", "powershell"]
 
+# One session per thread, because requests.Session is not documented as thread-safe
+_thread_local = threading.local()
+
 
 def _maybe_github_token_header(github_token: str | None) -> dict[str, str]:  # pragma: no cover
     return {} if github_token is None else {"Authorization": f"token {github_token}"}
 
 
+def http_session() -> requests.Session:
+    """Return this thread's session, so connections to GitHub are kept alive and reused."""
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+
+def _rate_limit_wait_seconds(response: requests.Response, retries: int) -> float:
+    """Return how long to wait before retrying a rate-limited request.
+
+    Follows GitHub's guidance: honor ``Retry-After`` (secondary rate limits), else
+    wait for ``X-RateLimit-Reset`` (primary), else back off exponentially from a minute.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return float(retry_after)
+        except ValueError:
+            pass  # HTTP-date form, fall back to the reset time or backoff
+    reset_time = response.headers.get("X-RateLimit-Reset")
+    if reset_time is not None:
+        return max(0, int(reset_time) - time.time()) + 1
+    return 60 * 2**retries
+
+
 def _github_api_get(
     url: str,
     headers: dict[str, str],
@@ -60,14 +97,16 @@ def _github_api_get(
     _retries: int = 0,
 ) -> requests.Response:
     """Make a GitHub API request with automatic rate limit handling."""
-    response = requests.get(url, headers=headers, timeout=30)
+    response = http_session().get(url, headers=headers, timeout=30)
 
-    # Handle rate limiting (max 3 retries)
-    if response.status_code == 403 and "rate limit" in response.text.lower():
+    # Handle (primary and secondary) rate limiting (max 3 retries)
+    rate_limited = response.status_code == 429 or (
+        response.status_code == 403 and "rate limit" in response.text.lower()
+    )
+    if rate_limited:
         if _retries >= 3:
             return response  # Give up after 3 retries
-        reset_time = int(response.headers.get("X-RateLimit-Reset", 0))
-        wait_seconds = max(0, reset_time - time.time()) + 1
+        wait_seconds = _rate_limit_wait_seconds(response, _retries)
         log(f"Rate limited. Waiting {wait_seconds:.0f}s until reset...", "warning")
         log(
             "Tip: Use `GITHUB_TOKEN=$(gh auth token) dotbins sync` for higher rate limits",
@@ -142,13 +181,23 @@ def fetch_release_info(
         raise RuntimeError(msg) from e
 
 
-def download_file(url: str, destination: str, github_token: str | None, verbose: bool) -> str:
-    """Download a file from a URL to a destination path."""
+def download_file(
+    url: str,
+    destination: str,
+    github_token: str | None,
+    verbose: bool,
+    session: requests.Session | None = None,
+) -> str:
+    """Download a file from a URL to a destination path.
+
+    Uses ``session`` when given, else the calling thread's `http_session`.
+    """
     log(f"Downloading from [b]{url}[/]", "info", "📥")
     # Already verbose when fetching release info
     headers = _maybe_github_token_header(github_token)
     try:
-        response = requests.get(url, stream=True, timeout=30, headers=headers)
+        session = session or http_session()
+        response = session.get(url, stream=True, timeout=30, headers=headers)
         response.raise_for_status()
         with open(destination, "wb") as f:
             for chunk in response.iter_content(chunk_size=8192):
@@ -452,7 +501,11 @@ def extract_archive(archive_path: str | Path, dest_dir: str | Path) -> None:
         # Handle tar archives
         for ext, mode in tar_formats.items():
             if filename.endswith(ext):
-                with tarfile.open(archive_path, mode=mode) as tar:  # type: ignore[call-overload]
+                # `bufsize` only applies to stream modes, so buffer the file object instead
+                with (
+                    open(archive_path, "rb", buffering=_TAR_BUFSIZE) as f,
+                    tarfile.open(fileobj=f, mode=mode) as tar,  # type: ignore[call-overload]
+                ):
                     tar.extractall(path=dest_dir)
                 return
 
@@ -467,7 +520,7 @@ def extract_archive(archive_path: str | Path, dest_dir: str | Path) -> None:
                 open_func(archive_path, "rb") as f_in,
                 open(output_path, "wb") as f_out,
             ):
-                shutil.copyfileobj(f_in, f_out)
+                shutil.copyfileobj(f_in, f_out, length=_COPY_BUFSIZE)
             if os.name != "nt":  # Skip on Windows
                 output_path.chmod(output_path.stat().st_mode | 0o755)
 
@@ -2,20 +2,83 @@
 
 from __future__ import annotations
 
+import gzip
+import io
+import stat
 import tarfile
-import tempfile
 import zipfile
-from pathlib import Path
-from typing import Callable
+from functools import cache
+from typing import TYPE_CHECKING, Callable
 
 import pytest
+import requests
+
+from dotbins.cli import create_parser
+
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Iterator
+    from pathlib import Path
+
+
+@pytest.fixture(scope="session")
+def parser() -> argparse.ArgumentParser:
+    """The CLI argument parser, built once per test session."""
+    return create_parser()
 
 
 @pytest.fixture
+def http_session() -> Iterator[requests.Session]:
+    """A session owned by a single test, closed when the test is done."""
+    with requests.Session() as session:
+        yield session
+
+
+@cache
+def _archive_bytes(
+    binary_names: tuple[str, ...],
+    archive_type: str,
+    binary_content: str,
+    nested_dir: str | None,
+) -> bytes:
+    """Build an archive once and return its contents, shared by all tests that need it."""
+    data = binary_content.encode()
+    prefix = f"{nested_dir}/" if nested_dir else ""
+    buffer = io.BytesIO()
+
+    # Create the archive in memory, no files need to exist on disk
+    if archive_type == "tar.gz":
+        # Tests only extract the archive, so the fastest compression is enough, and
+        # a fixed gzip and member mtime make the archive bytes reproducible
+        with (
+            gzip.GzipFile(fileobj=buffer, mode="wb", compresslevel=1, mtime=0) as gz,
+            tarfile.open(fileobj=gz, mode="w") as tar,
+        ):
+            for binary in binary_names:
+                tar_info = tarfile.TarInfo(prefix + binary)
+                tar_info.size = len(data)
+                tar_info.mode = 0o755
+                tar_info.mtime = 0
+                tar.addfile(tar_info, io.BytesIO(data))
+    elif archive_type == "zip":
+        with zipfile.ZipFile(buffer, "w") as zipf:
+            for binary in binary_names:
+                zip_info = zipfile.ZipInfo(prefix + binary)
+                zip_info.external_attr = (stat.S_IFREG | 0o755) << 16
+                zipf.writestr(zip_info, data)
+    else:  # pragma: no cover
+        msg = f"Unsupported archive type: {archive_type}"
+        raise ValueError(msg)
+
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
 def create_dummy_archive() -> Callable:
     r"""Create an archive file with binary files for testing.
 
     Returns a function that creates archive files with specified binaries.
+    The function is stateless, so it is shared by all tests in the session.
 
     Usage:
         archive_path = create_dummy_archive(
@@ -35,40 +98,8 @@ def create_dummy_archive() -> Callable:
     ) -> Path:
         if isinstance(binary_names, str):
             binary_names = [binary_names]
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
-
-            # Create nested directory if requested
-            if nested_dir:
-                bin_dir = tmp_path / nested_dir
-                bin_dir.mkdir(exist_ok=True, parents=True)
-            else:
-                bin_dir = tmp_path
-
-            created_files = []
-            for binary in binary_names:
-                # Create the binary file
-                bin_file = bin_dir / binary
-                bin_file.write_text(binary_content)
-                bin_file.chmod(0o755)
-                created_files.append(bin_file)
-
-            # Create the archive
-            if archive_type == "tar.gz":
-                with tarfile.open(dest_path, "w:gz") as tar:
-                    for file_path in created_files:
-                        archive_path = file_path.relative_to(tmp_path)
-                        tar.add(file_path, arcname=str(archive_path))
-            elif archive_type == "zip":
-                with zipfile.ZipFile(dest_path, "w") as zipf:
-                    for file_path in created_files:
-                        archive_path = file_path.relative_to(tmp_path)
-                        zipf.write(file_path, arcname=str(archive_path))
-            else:  # pragma: no cover
-                msg = f"Unsupported archive type: {archive_type}"
-                raise ValueError(msg)
-
-            return dest_path
+        data = _archive_bytes(tuple(binary_names), archive_type, binary_content, nested_dir)
+        dest_path.write_bytes(data)
+        return dest_path
 
     return _create_archive
@@ -3,26 +3,53 @@
 
 This script will download the JSON from the latest GitHub release for each tool
 listed in examples/examples.yaml and save it to tests/release_jsons/.
+Already downloaded JSONs are skipped unless ``--refresh`` is passed.
+
+Set ``GITHUB_TOKEN`` and/or ``GITHUB_TOKENS`` (comma-separated) to raise the
+rate limit; requests are spread round-robin over all given tokens.
 """
 # /// script
 # dependencies = [
 #   "requests",
 #   "pyyaml",
+#   "orjson",
 #   "dotbins",
 # ]
 # ///
 
+from __future__ import annotations
+
+import argparse
+import itertools
 import json
 import os
+import pickle
 import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path so we can import dotbins
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from dotbins.utils import _maybe_github_token_header
+from dotbins.utils import _maybe_github_token_header, execute_in_parallel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 # Extra repos that power tests but are not part of the public examples file.
 EXTRA_TOOLS = {
@@ -37,88 +64,248 @@ RELEASES_LIST_TOOLS = {
     "bw": {"repo": "bitwarden/clients", "per_page": 30},
 }
 
+# Repos with many release assets (slow responses), fetched before the rest
+LARGE_RELEASE_TOOLS = {"bw", "codex"}
+
+# Download priorities, higher runs first: full releases lists are the slowest responses
+PRIORITY_DEFAULT = 0
+PRIORITY_LARGE_RELEASE = 1
+PRIORITY_RELEASES_LIST = 2
+
+# Maximum number of concurrent requests to api.github.com. Bursting all
+# requests at once trips GitHub's secondary rate limits.
+MAX_CONCURRENT_REQUESTS = 10
+
+# Pause until the rate limit resets once fewer requests than this remain
+MIN_RATE_LIMIT_REMAINING = 5
+
+
+@dataclass
+class _RateLimit:
+    """Last seen GitHub rate limit of a single token (``None`` is unauthenticated)."""
+
+    token: str | None = None
+    remaining: int | None = None
+    reset: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def update(self, response: requests.Response) -> None:
+        """Record the rate limit reported in the response headers."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset = response.headers.get("X-RateLimit-Reset")
+        if remaining is None or reset is None:
+            return
+        with self.lock:
+            self.remaining = int(remaining)
+            self.reset = float(reset)
+
+    def exhausted(self) -> bool:
+        """Whether the rate limit is (nearly) used up and has not been reset yet."""
+        with self.lock:
+            return (
+                self.remaining is not None
+                and self.remaining < MIN_RATE_LIMIT_REMAINING
+                and self.reset > time.time()
+            )
+
+
+class _TokenPool:
+    """Hand out GitHub tokens round-robin, skipping those with an exhausted rate limit."""
+
+    def __init__(self, tokens: list[str | None]) -> None:
+        self.limits = [_RateLimit(token) for token in tokens]
+        self._cycle = itertools.cycle(self.limits)
+        self._lock = threading.Lock()
+
+    def acquire(self) -> _RateLimit:
+        """Return the next usable token, sleeping until a reset if all are exhausted."""
+        while True:
+            with self._lock:
+                for _ in range(len(self.limits)):
+                    limit = next(self._cycle)
+                    if not limit.exhausted():
+                        return limit
+                wait_seconds = min(limit.reset for limit in self.limits) - time.time()
+            if wait_seconds > 0:
+                print(f"Rate limit almost exhausted, waiting {wait_seconds:.0f}s until reset...")
+                time.sleep(wait_seconds)
+
+
+class _Job(NamedTuple):
+    """A single release JSON to download."""
+
+    name: str
+    url: str
+    json_file: Path
+    priority: int = PRIORITY_DEFAULT  # Jobs with a higher priority are scheduled first
+
+    @property
+    def etag_file(self) -> Path:
+        return self.json_file.with_suffix(".etag")
+
+
+def _load_examples(examples_yaml: Path, cache_file: Path) -> dict[str, Any]:
+    """Parse examples.yaml, reusing a pickled copy while the file is unchanged."""
+    stat = examples_yaml.stat()
+    key = (stat.st_mtime_ns, stat.st_size)
+    if cache_file.exists():
+        try:
+            with open(cache_file, "rb") as f:
+                cached_key, config = pickle.load(f)  # noqa: S301
+            if cached_key == key:
+                return config
+        except Exception:  # noqa: S110
+            pass  # A corrupt or stale pickle (e.g., after a class change) is rebuilt below
+
+    with open(examples_yaml) as f:
+        config = yaml.load(f, Loader=SafeLoader)
+    with open(cache_file, "wb") as f:
+        pickle.dump((key, config), f)
+    return config
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write pretty-printed JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def _github_tokens() -> list[str | None]:
+    """Collect tokens from ``GITHUB_TOKENS`` (comma-separated) and ``GITHUB_TOKEN``."""
+    tokens: list[str | None] = [
+        token.strip() for token in os.environ.get("GITHUB_TOKENS", "").split(",") if token.strip()
+    ]
+    token = os.environ.get("GITHUB_TOKEN")
+    if token and token not in tokens:
+        tokens.append(token)
+    return tokens or [None]
+
+
+def _create_session() -> requests.Session:
+    """Create a session that keeps connections to api.github.com alive.
+
+    Transient failures (rate limits and server errors) are retried with an
+    exponential backoff, honoring GitHub's ``Retry-After`` header.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=MAX_CONCURRENT_REQUESTS,
+        max_retries=retry,
+    )
+    session.mount("https://api.github.com", adapter)
+    return session
+
+
+def _download(job: _Job, session: requests.Session, tokens: _TokenPool) -> bool:
+    """Download a release JSON and save it to disk.
+
+    If the JSON was downloaded before, the stored ETag is sent along so that
+    GitHub can answer with a bodyless ``304 Not Modified`` instead.
+    """
+    limit = tokens.acquire()
+    headers = _maybe_github_token_header(limit.token)
+    if job.json_file.exists() and job.etag_file.exists():
+        headers["If-None-Match"] = job.etag_file.read_text().strip()
+
+    try:
+        response = session.get(job.url, headers=headers, timeout=30)
+        limit.update(response)
+        if response.status_code == 304:
+            print(f"Unchanged {job.json_file.name}")
+            return True
+        response.raise_for_status()
+        data = response.json()
+    except requests.RequestException as e:
+        print(f"Error downloading {job.name}: {e}")
+        return False
+
+    _write_json(job.json_file, data)
+    etag = response.headers.get("ETag")
+    if etag:
+        job.etag_file.write_text(etag)
+
+    print(f"Downloaded {job.json_file.name}")
+    return True
+
 
 def main() -> None:
     """Download release JSONs for all tools in examples.yaml."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Re-validate already downloaded JSONs (unchanged ones cost a 304 via their ETag)",
+    )
+    args = parser.parse_args()
+
     # Ensure release_jsons directory exists
     release_jsons_dir = Path(__file__).parent / "release_jsons"
     release_jsons_dir.mkdir(exist_ok=True)
 
     # Read examples.yaml
     examples_yaml = Path(__file__).parent.parent / "examples" / "examples.yaml"
-    with open(examples_yaml) as f:
-        config = yaml.safe_load(f)
-
-    # Get GitHub token if available
-    github_token = os.environ.get("GITHUB_TOKEN")
-    headers = _maybe_github_token_header(github_token)
+    config = _load_examples(examples_yaml, release_jsons_dir / ".examples_cache.pkl")
 
-    # Process each tool
     tools = dict(config.get("tools", {}))
     tools.update(EXTRA_TOOLS)
-    total = len(tools)
 
-    print(f"Downloading release JSONs for {total} tools...")
+    # List the directory once instead of a stat() call per tool
+    existing = set(os.listdir(release_jsons_dir))
 
-    for i, (tool_name, value) in enumerate(tools.items(), 1):
+    jobs: list[_Job] = []
+    for tool_name, value in tools.items():
         # Skip if already downloaded
         json_file = release_jsons_dir / f"{tool_name}.json"
-        if json_file.exists():
-            print(f"[{i}/{total}] Skipping {tool_name} (already downloaded)")
+        if json_file.name in existing and not args.refresh:
+            print(f"Skipping {tool_name} (already downloaded)")
             continue
 
         # Get repo
         repo = value if isinstance(value, str) else value.get("repo")
         if not repo:
-            print(f"[{i}/{total}] Skipping {tool_name} (no repo found)")
+            print(f"Skipping {tool_name} (no repo found)")
             continue
 
-        # Fetch release info
-        print(f"[{i}/{total}] Downloading {tool_name} from {repo}...")
         if "tag" in value:
             url = f"https://api.github.com/repos/{repo}/releases/tags/{value['tag']}"
         else:
             url = f"https://api.github.com/repos/{repo}/releases/latest"
+        priority = PRIORITY_LARGE_RELEASE if tool_name in LARGE_RELEASE_TOOLS else PRIORITY_DEFAULT
+        jobs.append(_Job(tool_name, url, json_file, priority))
 
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            release_data = response.json()
-
-            # Save to file
-            with open(json_file, "w") as f:
-                json.dump(release_data, f, indent=2)
-
-            print(f"[{i}/{total}] Downloaded {tool_name}")
-        except requests.RequestException as e:
-            print(f"[{i}/{total}] Error downloading {tool_name}: {e}")
-
-    print(f"\nDownloaded release JSONs to {release_jsons_dir}")
-
-    # Download releases lists for tools that need tag_pattern testing
-    print(f"\nDownloading releases lists for {len(RELEASES_LIST_TOOLS)} tools...")
-    for tool_name, config in RELEASES_LIST_TOOLS.items():
+    # Releases lists for tools that need tag_pattern testing
+    for tool_name, value in RELEASES_LIST_TOOLS.items():
         json_file = release_jsons_dir / f"{tool_name}_releases.json"
-        if json_file.exists():
-            print(f"Skipping {tool_name}_releases.json (already downloaded)")
+        if json_file.name in existing and not args.refresh:
+            print(f"Skipping {json_file.name} (already downloaded)")
             continue
 
-        repo = config["repo"]
-        per_page = config.get("per_page", 30)
-        url = f"https://api.github.com/repos/{repo}/releases?per_page={per_page}"
+        per_page = value.get("per_page", 30)
+        url = f"https://api.github.com/repos/{value['repo']}/releases?per_page={per_page}"
+        jobs.append(_Job(f"{tool_name} (releases list)", url, json_file, PRIORITY_RELEASES_LIST))
 
-        print(f"Downloading releases list for {tool_name} from {repo}...")
-        try:
-            response = requests.get(url, headers=headers, timeout=30)
-            response.raise_for_status()
-            releases_data = response.json()
+    # Start the slowest downloads first so no big one is left running on its own at the end
+    jobs.sort(key=lambda job: (-job.priority, job.name))
 
-            with open(json_file, "w") as f:
-                json.dump(releases_data, f, indent=2)
+    # Network-bound, so fetch all release JSONs concurrently
+    print(f"Downloading {len(jobs)} release JSONs...")
+    tokens = _TokenPool(_github_tokens())
+    with _create_session() as session:
+        download = partial(_download, session=session, tokens=tokens)
+        results = execute_in_parallel(jobs, download, max_workers=MAX_CONCURRENT_REQUESTS)
 
-            print(f"Downloaded {tool_name}_releases.json ({len(releases_data)} releases)")
-        except requests.RequestException as e:
-            print(f"Error downloading releases for {tool_name}: {e}")
+    print(f"\nDownloaded {sum(results)}/{len(jobs)} release JSONs to {release_jsons_dir}")
 
 
 if __name__ == "__main__":
@@ -10,6 +10,7 @@ from dotbins import cli
 from dotbins.config import Config, build_tool_config
 
 if TYPE_CHECKING:
+    import argparse
     from pathlib import Path
 
     import pytest
@@ -89,11 +90,8 @@ def test_cli_tools_dir_override(tmp_path: Path) -> None:
     """Test overriding tools directory via CLI."""
     custom_dir = tmp_path / "custom_tools"
 
-    # Mock config loading to return a predictable config
-    def mock_load_config(
-        *args: Any,  # noqa: ARG001
-        **kwargs: Any,  # noqa: ARG001
-    ) -> Config:
+    # Load a predictable config instead of reading one from disk
+    def load_config(config_file: str | None) -> Config:  # noqa: ARG001
         config = Config(
             tools_dir=tmp_path / "default_tools",
             platforms={"linux": ["amd64"]},
@@ -101,21 +99,25 @@ def test_cli_tools_dir_override(tmp_path: Path) -> None:
         config.config_path = tmp_path / "custom_tools" / "dotbins.yaml"
         return config
 
-    # Patch config loading
-    with (
-        patch.object(Config, "from_file", mock_load_config),
-        patch.object(sys, "argv", ["dotbins", "--tools-dir", str(custom_dir), "init"]),
-    ):
-        cli.main()
+    cli.run(["--tools-dir", str(custom_dir), "init"], config_loader=load_config)
 
     # Check if directories were created in the custom location
     assert (custom_dir / "linux" / "amd64" / "bin").exists()
 
 
-def test_cli_argument_parsing() -> None:
-    """Test CLI argument parsing for readme and no-readme options."""
-    parser = cli.create_parser()
+def test_cli_run_uses_patched_config_loader(tmp_path: Path) -> None:
+    """Test that run() looks up Config.from_file at call time, so patching it works."""
+    config = Config(tools_dir=tmp_path / "tools", platforms={"linux": ["amd64"]})
+    config.config_path = tmp_path / "tools" / "dotbins.yaml"
+    with patch.object(Config, "from_file", return_value=config) as mock_from_file:
+        cli.run(["init"])
+
+    mock_from_file.assert_called_once_with(None)
+    assert (tmp_path / "tools" / "linux" / "amd64" / "bin").exists()
 
+
+def test_cli_argument_parsing(parser: argparse.ArgumentParser) -> None:
+    """Test CLI argument parsing for readme and no-readme options."""
     # Test readme command
     args = parser.parse_args(["readme"])
     assert args.command == "readme"
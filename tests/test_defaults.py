@@ -1,50 +1,42 @@
 """Tests for defaults in asset detection."""
 
+import pytest
+
 from dotbins.detect_asset import _prioritize_assets, create_system_detector
 
+# Shared between the parametrized cases below; tuples so no test can mutate them
+LIBC_ASSETS = (
+    "ripgrep-13.0.0-x86_64-unknown-linux-gnu.tar.gz",
+    "ripgrep-13.0.0-x86_64-unknown-linux-musl.tar.gz",
+)
 
-def test_libc_preference() -> None:
-    """Test that libc preference works correctly."""
-    assets = [
-        "ripgrep-13.0.0-x86_64-unknown-linux-gnu.tar.gz",
-        "ripgrep-13.0.0-x86_64-unknown-linux-musl.tar.gz",
-    ]
+APPIMAGE_ASSETS = (
+    "ripgrep-13.0.0-x86_64-unknown-linux-gnu.tar.gz",
+    "ripgrep-13.0.0-x86_64-linux.AppImage",
+)
 
-    # Test preference for glibc
-    detector = create_system_detector("linux", "amd64", libc_preference="glibc")
-    _asset, matches, err = detector(assets)
-    assert err == "2 arch matches found"
-    assert matches is not None
-    assert "gnu" in matches[0]
 
-    # Test preference for musl
-    detector = create_system_detector("linux", "amd64", libc_preference="musl")
-    _asset, matches, err = detector(assets)
+@pytest.mark.parametrize(
+    ("libc_preference", "expected"),
+    [("glibc", "gnu"), ("musl", "musl")],
+)
+def test_libc_preference(libc_preference: str, expected: str) -> None:
+    """Test that libc preference works correctly."""
+    detector = create_system_detector("linux", "amd64", libc_preference=libc_preference)
+    _asset, matches, err = detector(list(LIBC_ASSETS))
     assert err == "2 arch matches found"
     assert matches is not None
-    assert "musl" in matches[0]
+    assert expected in matches[0]
 
 
-def test_appimage_preference() -> None:
+@pytest.mark.parametrize("prefer_appimage", [True, False])
+def test_appimage_preference(prefer_appimage: bool) -> None:
     """Test that AppImage preference works correctly."""
-    assets = [
-        "ripgrep-13.0.0-x86_64-unknown-linux-gnu.tar.gz",
-        "ripgrep-13.0.0-x86_64-linux.AppImage",
-    ]
-
-    # Test preference for AppImage=True
-    detector = create_system_detector("linux", "amd64", prefer_appimage=True)
-    _asset, matches, err = detector(assets)
+    detector = create_system_detector("linux", "amd64", prefer_appimage=prefer_appimage)
+    _asset, matches, err = detector(list(APPIMAGE_ASSETS))
     assert err == "2 arch matches found"
     assert matches is not None
-    assert matches[0].endswith(".AppImage")
-
-    # Test preference for AppImage=False
-    detector = create_system_detector("linux", "amd64", prefer_appimage=False)
-    _asset, matches, err = detector(assets)
-    assert err == "2 arch matches found"
-    assert matches is not None
-    assert not matches[0].endswith(".AppImage")
+    assert matches[0].endswith(".AppImage") is prefer_appimage
 
 
 def test_arch_specific_preferences() -> None:
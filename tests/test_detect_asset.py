@@ -1,5 +1,9 @@
 """Tests for the dotbins.detect_asset module."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 import pytest
 
 from dotbins.detect_asset import (
@@ -17,66 +21,70 @@ from dotbins.detect_asset import (
     detect_single_asset,
 )
 
-
-def test_os_match() -> None:
+if TYPE_CHECKING:
+    from dotbins.detect_asset import _OS, _Arch
+
+
+@pytest.mark.parametrize(
+    ("os_obj", "asset", "expected"),
+    [
+        # Test basic OS matching
+        (OSDarwin, "darwin-amd64.tar.gz", True),
+        (OSDarwin, "macos-amd64.tar.gz", True),
+        (OSDarwin, "osx-amd64.tar.gz", True),
+        (OSDarwin, "linux-amd64.tar.gz", False),
+        # Test with anti-pattern
+        (OSLinux, "linux-amd64.tar.gz", True),
+        (OSLinux, "ubuntu-amd64.tar.gz", True),
+        (OSLinux, "android-amd64.tar.gz", False),
+        # Test with AppImage files (AppImage files are always for Linux)
+        (OSLinux, "app.appimage", True),
+        (OSLinux, "linux-app.appimage", True),
+    ],
+)
+def test_os_match(os_obj: _OS, asset: str, expected: bool) -> None:
     """Test the match_os function."""
-    # Test basic OS matching
-    assert _match_os(OSDarwin, "darwin-amd64.tar.gz") is True
-    assert _match_os(OSDarwin, "macos-amd64.tar.gz") is True
-    assert _match_os(OSDarwin, "osx-amd64.tar.gz") is True
-    assert _match_os(OSDarwin, "linux-amd64.tar.gz") is False
-
-    # Test with anti-pattern
-    assert _match_os(OSLinux, "linux-amd64.tar.gz") is True
-    assert _match_os(OSLinux, "ubuntu-amd64.tar.gz") is True
-    assert _match_os(OSLinux, "android-amd64.tar.gz") is False
-
-    # Test with AppImage files
-    assert _match_os(OSLinux, "app.appimage") is True  # AppImage files are always for Linux
-    assert _match_os(OSLinux, "linux-app.appimage") is True
-
-
-def test_arch_match() -> None:
+    assert _match_os(os_obj, asset) is expected
+
+
+@pytest.mark.parametrize(
+    ("arch", "asset", "expected"),
+    [
+        # Test basic arch matching
+        (ArchAMD64, "linux-amd64.tar.gz", True),
+        (ArchAMD64, "linux-x86_64.tar.gz", True),
+        (ArchAMD64, "linux-x64.tar.gz", True),
+        (ArchAMD64, "linux-386.tar.gz", False),
+        # Test the `-64` and `_64` pattern additions
+        (ArchAMD64, "linux-64.tar.gz", True),
+        (ArchAMD64, "linux_64.tar.gz", True),
+        (ArchAMD64, "micromamba-linux-64", True),
+        (ArchAMD64, "app_linux_64", True),
+        (ArchAMD64, "linux-64bit.tar.gz", True),  # Not at word boundary
+        # Verify we don't get false positives
+        (ArchAMD64, "linux-arm64.tar.gz", False),  # Should match ARM64, not AMD64
+        (ArchAMD64, "linux-riscv64.tar.gz", False),  # Should match RISCV64, not AMD64
+        (ArchAMD64, "something-with-64-in-name.tar.gz", False),  # Not matching the pattern
+        (ArchAMD64, "with64suffix.tar.gz", False),  # Not at word boundary
+        (ArchI686, "linux-i386.tar.gz", True),
+        (ArchI686, "linux-386.tar.gz", True),
+        (ArchI686, "linux-x86_32.tar.gz", True),
+        (ArchI686, "linux-amd64.tar.gz", False),
+        (ArchArm, "linux-arm.tar.gz", True),
+        (ArchArm, "linux-armv6.tar.gz", True),
+        (ArchArm, "linux-arm32.tar.gz", True),
+        (ArchArm, "linux-amd64.tar.gz", False),
+        (ArchArm64, "linux-arm64.tar.gz", True),
+        (ArchArm64, "linux-aarch64.tar.gz", True),
+        (ArchArm64, "linux-armv8.tar.gz", True),
+        (ArchArm64, "linux-amd64.tar.gz", False),
+        (ArchRiscv64, "linux-riscv64.tar.gz", True),
+        (ArchRiscv64, "linux-amd64.tar.gz", False),
+    ],
+)
+def test_arch_match(arch: _Arch, asset: str, expected: bool) -> None:
     """Test the match_arch function."""
-    # Test basic arch matching
-    assert _match_arch(ArchAMD64, "linux-amd64.tar.gz")
-    assert _match_arch(ArchAMD64, "linux-x86_64.tar.gz")
-    assert _match_arch(ArchAMD64, "linux-x64.tar.gz")
-    assert not _match_arch(ArchAMD64, "linux-386.tar.gz")
-
-    # Test the `-64` and `_64` pattern additions
-    assert _match_arch(ArchAMD64, "linux-64.tar.gz")
-    assert _match_arch(ArchAMD64, "linux_64.tar.gz")
-    assert _match_arch(ArchAMD64, "micromamba-linux-64")
-    assert _match_arch(ArchAMD64, "app_linux_64")
-    assert _match_arch(ArchAMD64, "linux-64bit.tar.gz")  # Not at word boundary
-
-    # Verify we don't get false positives
-    assert not _match_arch(ArchAMD64, "linux-arm64.tar.gz")  # Should match ARM64, not AMD64
-    assert not _match_arch(ArchAMD64, "linux-riscv64.tar.gz")  # Should match RISCV64, not AMD64
-    assert not _match_arch(
-        ArchAMD64,
-        "something-with-64-in-name.tar.gz",
-    )  # Not matching the pattern
-    assert not _match_arch(ArchAMD64, "with64suffix.tar.gz")  # Not at word boundary
-
-    assert _match_arch(ArchI686, "linux-i386.tar.gz")
-    assert _match_arch(ArchI686, "linux-386.tar.gz")
-    assert _match_arch(ArchI686, "linux-x86_32.tar.gz")
-    assert not _match_arch(ArchI686, "linux-amd64.tar.gz")
-
-    assert _match_arch(ArchArm, "linux-arm.tar.gz")
-    assert _match_arch(ArchArm, "linux-armv6.tar.gz")
-    assert _match_arch(ArchArm, "linux-arm32.tar.gz")
-    assert not _match_arch(ArchArm, "linux-amd64.tar.gz")
-
-    assert _match_arch(ArchArm64, "linux-arm64.tar.gz")
-    assert _match_arch(ArchArm64, "linux-aarch64.tar.gz")
-    assert _match_arch(ArchArm64, "linux-armv8.tar.gz")
-    assert not _match_arch(ArchArm64, "linux-amd64.tar.gz")
-
-    assert _match_arch(ArchRiscv64, "linux-riscv64.tar.gz")
-    assert not _match_arch(ArchRiscv64, "linux-amd64.tar.gz")
+    assert _match_arch(arch, asset) is expected
 
 
 def test_single_asset_detector_detect() -> None:
@@ -27,13 +27,14 @@ def _create_mock_release_info(
     platforms: dict[str, list[str]],
     extension: str = ".tar.gz",
 ) -> dict[str, Any]:
+    version = tag[1:]
+    names = [
+        f"{tool_name}-{version}-{platform}_{arch}{extension}"
+        for platform, archs in platforms.items()
+        for arch in archs
+    ]
     assets = [
-        {
-            "name": f"{tool_name}-{tag[1:]}-{platform}_{arch}{extension}",
-            "browser_download_url": f"https://example.com/{tool_name}-{tag[1:]}-{platform}_{arch}{extension}",
-        }
-        for platform in platforms
-        for arch in platforms[platform]
+        {"name": name, "browser_download_url": f"https://example.com/{name}"} for name in names
     ]
     return {"tag_name": tag, "assets": assets}
 
@@ -732,7 +733,7 @@ def test_get_tool_command_with_remote_config(
         return destination
 
     with (
-        patch("dotbins.utils.requests.get", side_effect=mock_requests_get),
+        patch("dotbins.utils.requests.Session.get", side_effect=mock_requests_get),
         patch("dotbins.download.download_file", side_effect=mock_download_file),
         patch("dotbins.config.fetch_release_info", side_effect=mock_fetch_release_info),
     ):
@@ -1274,7 +1275,7 @@ def test_download_file_request_exception(
         raise requests.RequestException(err_msg)
 
     with (
-        patch("dotbins.utils.requests.get", side_effect=mock_requests_get),
+        patch("dotbins.utils.requests.Session.get", side_effect=mock_requests_get),
     ):
         config.sync_tools(verbose=False)  # Turn off verbose to reduce processing
 
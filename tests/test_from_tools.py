@@ -15,8 +15,10 @@ if TYPE_CHECKING:
 
 TOOLS = ["fzf", "bat", "eza", "zoxide", "uv"]
 
+_REPO_RE = re.compile(r"^[^/]+/[^/]+\Z")
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def tools_config() -> dict[str, ToolConfig]:
     """Load tools configuration from dotbins.yaml."""
     script_dir = Path(__file__).parent.parent
@@ -38,8 +40,7 @@ def test_tool_has_repo_defined(
     assert tool_config.repo, f"Tool {tool_name} has empty repository value"
 
     # Validate repo format (owner/repo)
-    assert re.match(
-        r"^[^/]+/[^/]+$",
+    assert _REPO_RE.match(
         tool_config.repo,
     ), f"Tool {tool_name} repo '{tool_config.repo}' is not in owner/repo format"
 
@@ -1,32 +1,33 @@
 """Tests for the Manifest class."""
 
 import json
-import os
+import sys
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from dotbins.config import Config
-from dotbins.manifest import MANIFEST_VERSION, Manifest
+from dotbins.manifest import MANIFEST_VERSION, Manifest, _dumps
 
 
-@pytest.fixture
-def temp_version_file(tmp_path: Path) -> Path:
-    """Create a temporary version file with sample data."""
-    manifest_file = tmp_path / "manifest.json"
-
-    # Sample version data
+@pytest.fixture(scope="session")
+def version_data_blob() -> bytes:
+    """Serialized sample version data, built once per test session."""
     version_data = {
         "fzf/linux/amd64": {"tag": "0.29.0", "updated_at": "2023-01-01T12:00:00"},
         "bat/macos/arm64": {"tag": "0.18.3", "updated_at": "2023-01-02T14:30:00"},
         "version": 2,
     }
+    return json.dumps(version_data).encode()
 
-    # Write to file
-    with open(manifest_file, "w") as f:
-        json.dump(version_data, f)
 
+@pytest.fixture
+def temp_version_file(tmp_path: Path, version_data_blob: bytes) -> Path:
+    """Create a temporary version file with sample data."""
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_bytes(version_data_blob)
     return manifest_file
 
 
@@ -97,11 +98,10 @@ def test_manifest_update_tool_info(tmp_path: Path) -> None:
     datetime.fromisoformat(info["updated_at"])  # Should not raise exception
 
     # Verify the file was created
-    assert os.path.exists(tmp_path / "manifest.json")
+    assert (tmp_path / "manifest.json").exists()
 
     # Read the file and check contents
-    with open(tmp_path / "manifest.json") as f:
-        saved_data = json.load(f)
+    saved_data = json.loads((tmp_path / "manifest.json").read_bytes())
 
     assert "ripgrep/linux/amd64" in saved_data
     assert saved_data["ripgrep/linux/amd64"]["tag"] == "13.0.0"
@@ -123,8 +123,60 @@ def test_manifest_save_creates_parent_dirs(tmp_path: Path) -> None:
     )
 
     # Verify directories and file were created
-    assert os.path.exists(nested_dir)
-    assert os.path.exists(nested_dir / "manifest.json")
+    assert nested_dir.exists()
+    assert (nested_dir / "manifest.json").exists()
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="Symlinks need extra privileges")
+def test_manifest_save_through_symlink(tmp_path: Path) -> None:
+    """Test that saving writes through a symlinked manifest instead of replacing the link."""
+    real_manifest = tmp_path / "real" / "manifest.json"
+    real_manifest.parent.mkdir()
+    real_manifest.write_bytes(json.dumps({"version": MANIFEST_VERSION}).encode())
+    tools_dir = tmp_path / "tools"
+    tools_dir.mkdir()
+    (tools_dir / "manifest.json").symlink_to(real_manifest)
+
+    manifest = Manifest(tools_dir)
+    manifest.update_tool_info(
+        tool="test",
+        platform="linux",
+        arch="amd64",
+        tag="1.0.0",
+        sha256="sha256",
+        url="https://example.com/test-1.0.0-linux_amd64.tar.gz",
+    )
+
+    assert (tools_dir / "manifest.json").is_symlink()
+    saved_data = json.loads(real_manifest.read_bytes())
+    assert saved_data["test/linux/amd64"]["tag"] == "1.0.0"
+    assert not list(tools_dir.glob(".*.tmp"))
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="No POSIX permission bits")
+def test_manifest_save_keeps_permissions(tmp_path: Path, temp_version_file: Path) -> None:
+    """Test that replacing the manifest keeps its permission bits."""
+    temp_version_file.chmod(0o600)
+    Manifest(tmp_path).save()
+    assert temp_version_file.stat().st_mode & 0o777 == 0o600
+
+
+def test_manifest_save_failure_leaves_no_tmp_file(tmp_path: Path, temp_version_file: Path) -> None:
+    """Test that a failed save leaves the manifest untouched and no temporary file behind."""
+    original = temp_version_file.read_bytes()
+    manifest = Manifest(tmp_path)
+    with (
+        patch("dotbins.manifest.os.replace", side_effect=OSError("disk full")),
+        pytest.raises(OSError, match="disk full"),
+    ):
+        manifest.save()
+    with (
+        patch("dotbins.manifest._dumps", side_effect=TypeError("not serializable")),
+        pytest.raises(TypeError, match="not serializable"),
+    ):
+        manifest.save()
+    assert temp_version_file.read_bytes() == original
+    assert list(tmp_path.iterdir()) == [temp_version_file]
 
 
 def test_manifest_load_invalid_json(tmp_path: Path) -> None:
@@ -132,8 +184,7 @@ def test_manifest_load_invalid_json(tmp_path: Path) -> None:
     manifest_file = tmp_path / "manifest.json"
 
     # Write invalid JSON
-    with open(manifest_file, "w") as f:
-        f.write("{ this is not valid JSON")
+    manifest_file.write_bytes(b"{ this is not valid JSON")
 
     # Should handle gracefully and return empty dict
     manifest = Manifest(tmp_path)
@@ -173,6 +224,33 @@ def test_manifest_update_existing(
     assert updated_time > original_time
 
 
+def test_manifest_batch_saves_once(tmp_path: Path) -> None:
+    """Test that updates inside a batch are written to disk once, when it exits."""
+    manifest = Manifest(tmp_path)
+
+    with manifest.batch():
+        # Nothing is updated, so nothing is written
+        pass
+    assert not manifest.manifest_file.exists()
+
+    with patch.object(manifest, "save", wraps=manifest.save) as mock_save:
+        with manifest.batch():
+            for arch in ["amd64", "arm64", "i686"]:
+                manifest.update_tool_info(
+                    tool="ripgrep",
+                    platform="linux",
+                    arch=arch,
+                    tag="13.0.0",
+                    sha256="sha256",
+                    url=f"https://example.com/ripgrep-13.0.0-linux_{arch}.tar.gz",
+                )
+            assert not manifest.manifest_file.exists()
+        assert mock_save.call_count == 1
+
+    saved_data = json.loads(manifest.manifest_file.read_bytes())
+    assert {"ripgrep/linux/amd64", "ripgrep/linux/arm64", "ripgrep/linux/i686"} <= set(saved_data)
+
+
 def test_manifest_print(
     tmp_path: Path,
     capsys: pytest.CaptureFixture[str],
@@ -232,30 +310,31 @@ def test_manifest_print_compact(
     assert "No tool versions recorded yet." in out
 
     # Add multiple versions of the same tool
-    manifest.update_tool_info(
-        tool="testtool",
-        platform="linux",
-        arch="amd64",
-        tag="1.0.0",
-        sha256="sha256",
-        url="https://example.com/testtool-1.0.0-linux_amd64.tar.gz",
-    )
-    manifest.update_tool_info(
-        tool="testtool",
-        platform="macos",
-        arch="arm64",
-        tag="1.0.0",
-        sha256="sha256",
-        url="https://example.com/testtool-1.0.0-macos_arm64.tar.gz",
-    )
-    manifest.update_tool_info(
-        tool="othertool",
-        platform="linux",
-        arch="amd64",
-        tag="2.0.0",
-        sha256="sha256",
-        url="https://example.com/othertool-2.0.0-linux_amd64.tar.gz",
-    )
+    with manifest.batch():
+        manifest.update_tool_info(
+            tool="testtool",
+            platform="linux",
+            arch="amd64",
+            tag="1.0.0",
+            sha256="sha256",
+            url="https://example.com/testtool-1.0.0-linux_amd64.tar.gz",
+        )
+        manifest.update_tool_info(
+            tool="testtool",
+            platform="macos",
+            arch="arm64",
+            tag="1.0.0",
+            sha256="sha256",
+            url="https://example.com/testtool-1.0.0-macos_arm64.tar.gz",
+        )
+        manifest.update_tool_info(
+            tool="othertool",
+            platform="linux",
+            arch="amd64",
+            tag="2.0.0",
+            sha256="sha256",
+            url="https://example.com/othertool-2.0.0-linux_amd64.tar.gz",
+        )
 
     manifest._print_compact()
     out, _ = capsys.readouterr()
@@ -366,8 +445,7 @@ def test_legacy_version_store_is_upgraded(
     }
 
     # Write to file
-    with open(version_file, "w") as f:
-        json.dump(version_data, f)
+    version_file.write_bytes(json.dumps(version_data).encode())
 
     # Load the manifest
     manifest = Manifest(tmp_path)
@@ -429,3 +507,16 @@ def test_tool_to_tag_mapping_warning(
 
     # The mapping should contain one of the tags (the first one encountered)
     assert mapping == {"my-tool": "v1.1.0"}
+
+
+def test_manifest_dumps_matches_orjson() -> None:
+    """Test that the json fallback writes the same bytes as orjson."""
+    orjson = pytest.importorskip("orjson")
+    data = {
+        "version": MANIFEST_VERSION,
+        "tool/linux/amd64": {"tag": "v1.0.0", "url": "https://example.com/ünïcode"},
+    }
+    with patch("dotbins.manifest.orjson", None):
+        fallback = _dumps(data)
+    assert fallback == orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    assert "ünïcode".encode() in fallback
@@ -2,23 +2,48 @@
 
 from __future__ import annotations
 
-import tempfile
+import copy
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import TYPE_CHECKING, Any, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from dotbins.config import Config
 from dotbins.readme import generate_readme_content, write_readme_file
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-@pytest.fixture
-def mock_config() -> Config:
-    """Create a mock Config object for testing."""
-    config = MagicMock(spec=Config)
-    config.tools_dir = Path("/home/user/.dotbins")
-    config.platforms = {"linux": ["amd64", "arm64"], "macos": ["arm64"]}
+    from dotbins.config import Config
+
+
+# Read-only manifest entry shared by every mocked get_tool_info call
+_TOOL_INFO = MappingProxyType({"tag": "1.0.0", "updated_at": "2023-01-01"})
+
+# Manifest entries per tool, looked up by the mocked get_tool_info
+_ALL_INSTALLED = MappingProxyType({"tool1": _TOOL_INFO, "tool2": _TOOL_INFO})
+_TOOL2_MISSING = MappingProxyType({"tool1": _TOOL_INFO})
+
+
+def _stub_config(**attributes: Any) -> Config:
+    """Create a lightweight stand-in for Config with only the given attributes.
+
+    Much cheaper to build than ``MagicMock(spec=Config)``, which introspects the whole class.
+    """
+    return cast("Config", SimpleNamespace(**attributes))
 
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_current_platform() -> Iterator[MagicMock]:
+    """Pretend to run on macOS arm64, patched once for the whole module."""
+    with patch("dotbins.readme.current_platform", return_value=("macos", "arm64")) as mock:
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def shared_mock_config() -> Config:
+    """Create a mock Config object once for the whole module."""
     # Mock tools
     tool1 = MagicMock()
     tool1.tool_name = "tool1"
@@ -30,34 +55,38 @@ def mock_config() -> Config:
     tool2.repo = "user/tool2"
     tool2.binary_name = ["tool2"]
 
-    config.tools = {"tool1": tool1, "tool2": tool2}
-
     # Mock Manifest
     manifest = MagicMock()
-    manifest.get_tool_info.side_effect = lambda tool, _platform, _arch: (
-        {
-            "tag": "1.0.0",
-            "updated_at": "2023-01-01",
-        }
-        if tool in ["tool1", "tool2"]
-        else None
+    manifest.get_tool_info.side_effect = lambda tool, _platform, _arch: _ALL_INSTALLED.get(tool)
+
+    # Mock bin_dir to return a non-existent directory
+    bin_dir = MagicMock()
+    bin_dir.return_value.exists.return_value = False
+
+    return _stub_config(
+        tools_dir=Path("/home/user/.dotbins"),
+        platforms={"linux": ["amd64", "arm64"], "macos": ["arm64"]},
+        tools={"tool1": tool1, "tool2": tool2},
+        manifest=manifest,
+        bin_dir=bin_dir,
+        config_path=None,
     )
 
-    config.manifest = manifest
 
-    # Mock bin_dir to return a non-existent directory
-    config.bin_dir.return_value = MagicMock()
-    config.bin_dir.return_value.exists.return_value = False
+@pytest.fixture
+def mock_config(shared_mock_config: Config) -> Config:
+    """Shallow copy of the shared mock Config, so tests can reassign its attributes."""
+    return copy.copy(shared_mock_config)
 
-    return config
 
+@pytest.fixture(scope="module")
+def default_readme(shared_mock_config: Config) -> str:
+    """README content for the unmodified mock Config, generated once for the whole module."""
+    return generate_readme_content(shared_mock_config)
 
-@patch("dotbins.readme.current_platform")
-def test_generate_readme_content(mock_current_platform: MagicMock, mock_config: Config) -> None:
-    """Test that README content is correctly generated."""
-    # Mock the current platform
-    mock_current_platform.return_value = ("macos", "arm64")
 
+def test_generate_readme_content(mock_config: Config) -> None:
+    """Test that README content is correctly generated."""
     # Patch os.path.expanduser to return a fixed path for testing
     with (
         patch("os.path.expanduser", return_value="/home/user"),
@@ -117,45 +146,32 @@ def test_generate_readme_content(mock_current_platform: MagicMock, mock_config:
     assert "Jan 01, 2023" in content
 
 
-def test_write_readme_file() -> None:
+def test_write_readme_file(tmp_path: Path) -> None:
     """Test that README file is correctly written."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmp_path = Path(tmpdir)
-
-        # Create mock config
-        config = MagicMock(spec=Config)
-        config.tools_dir = tmp_path
+    # Create mock config
+    config = _stub_config(tools_dir=tmp_path)
 
-        # Mock generate_readme_content to return a simple string
-        with patch("dotbins.readme.generate_readme_content", return_value="# Test README"):
-            # Call the function
-            write_readme_file(config, print_content=True, write_file=True, verbose=True)
+    # Mock generate_readme_content to return a simple string
+    with patch("dotbins.readme.generate_readme_content", return_value="# Test README"):
+        # Call the function
+        write_readme_file(config, print_content=True, write_file=True, verbose=True)
 
-            # Check if file was created
-            readme_path = tmp_path / "README.md"
-            assert readme_path.exists()
+    # Check if file was created
+    readme_path = tmp_path / "README.md"
+    assert readme_path.exists()
 
-            # Check content
-            with open(readme_path) as f:
-                content = f.read()
-                assert content == "# Test README"
+    # Check content
+    with open(readme_path) as f:
+        content = f.read()
+        assert content == "# Test README"
 
 
-@patch("dotbins.readme.current_platform")
-def test_readme_with_missing_tools(mock_current_platform: MagicMock, mock_config: Config) -> None:
+def test_readme_with_missing_tools(mock_config: Config) -> None:
     """Test README generation when some tools have no version info."""
-    # Mock the current platform
-    mock_current_platform.return_value = ("macos", "arm64")
-
-    # Update mock to return None for tool2
-    mock_config.manifest.get_tool_info.side_effect = lambda tool, _platform, _arch: (  # type: ignore[attr-defined]
-        {
-            "tag": "1.0.0",
-            "updated_at": "2023-01-01",
-        }
-        if tool == "tool1"
-        else None
-    )
+    # Replace the (shared) manifest mock with one that returns None for tool2
+    manifest = MagicMock()
+    manifest.get_tool_info.side_effect = lambda tool, _platform, _arch: _TOOL2_MISSING.get(tool)
+    mock_config.manifest = manifest
 
     # Generate content
     content = generate_readme_content(mock_config)
@@ -167,15 +183,8 @@ def test_readme_with_missing_tools(mock_current_platform: MagicMock, mock_config
     # as it has no installation info
 
 
-@patch("dotbins.readme.current_platform")
-def test_readme_with_home_path_replacement(
-    mock_current_platform: MagicMock,
-    mock_config: Config,
-) -> None:
+def test_readme_with_home_path_replacement(mock_config: Config) -> None:
     """Test that home paths are correctly replaced with $HOME."""
-    # Mock the current platform
-    mock_current_platform.return_value = ("macos", "arm64")
-
     # Set up a path with a real home directory
     with patch("os.path.expanduser", return_value="/home/testuser"):
         # Set the tools directory path to include the home path
@@ -189,14 +198,9 @@ def test_readme_with_home_path_replacement(
         assert "/home/testuser/some/path" not in content
 
 
-@patch("dotbins.readme.current_platform")
-def test_readme_table_formatting(mock_current_platform: MagicMock, mock_config: Config) -> None:
+def test_readme_table_formatting(default_readme: str) -> None:
     """Test that the table in the README is correctly formatted."""
-    # Mock the current platform
-    mock_current_platform.return_value = ("macos", "arm64")
-
-    # Generate content
-    content = generate_readme_content(mock_config)
+    content = default_readme
 
     # Check table headers
     assert "| Tool | Repository | Version | Updated | Platforms & Architectures |" in content
@@ -210,21 +214,15 @@ def test_write_readme_file_handles_exception(
     capsys: pytest.CaptureFixture,
 ) -> None:
     """Test that write_readme_file properly handles exceptions."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        Path(tmpdir)
-
-        # Create mock config
-        config = MagicMock(spec=Config)
-        config.tools_dir = Path("/non/existent/path")  # Path that doesn't exist
-
-        # Mock generate_readme_content to return a simple string
-        with (
-            patch("dotbins.readme.generate_readme_content", return_value="# Test README"),
-        ):
-            # Call the function
-            write_readme_file(config, verbose=True)
-
-            # Verify exception is logged
-            captured = capsys.readouterr()
-            out = captured.out
-            assert "No such file or directory" in out, out
+    # Create mock config
+    config = _stub_config(tools_dir=Path("/non/existent/path"))  # Path that doesn't exist
+
+    # Mock generate_readme_content to return a simple string
+    with patch("dotbins.readme.generate_readme_content", return_value="# Test README"):
+        # Call the function
+        write_readme_file(config, verbose=True)
+
+    # Verify exception is logged
+    captured = capsys.readouterr()
+    out = captured.out
+    assert "No such file or directory" in out, out
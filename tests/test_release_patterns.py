@@ -3,7 +3,9 @@
 import json
 import re
 import sys
+from functools import cache
 from pathlib import Path
+from typing import Any
 
 import pytest
 
@@ -287,6 +289,16 @@ CASES = [
 ]
 
 
+RELEASE_JSONS_DIR = Path(__file__).parent / "release_jsons"
+
+
+@cache
+def _load_release_json(name: str) -> Any:
+    """Load a release JSON once, it is shared by all cases of the same tool (read-only)."""
+    with open(RELEASE_JSONS_DIR / f"{name}.json") as f:
+        return json.load(f)
+
+
 @pytest.mark.parametrize(
     ("program", "platform", "arch", "expected_asset"),
     CASES,
@@ -305,9 +317,7 @@ def test_autodetect_asset(program: str, platform: str, arch: str, expected_asset
     if "@" in program:
         program, tag = program.split("@")
 
-    json_file = Path(__file__).parent / "release_jsons" / f"{program}.json"
-    with open(json_file) as f:
-        release_data = json.load(f)
+    release_data = _load_release_json(program)
 
     defaults = {
         "windows_abi": "msvc",
@@ -362,9 +372,7 @@ def test_tag_pattern_filtering() -> None:
     multiple products from the same repository.
     """
     # Load the releases list JSON (not the single "latest" release)
-    json_file = Path(__file__).parent / "release_jsons" / "bw_releases.json"
-    with open(json_file) as f:
-        releases_data = json.load(f)
+    releases_data = _load_release_json("bw_releases")
 
     tag_pattern = "^cli-"
 
@@ -422,8 +430,7 @@ def test_tag_pattern_filtering() -> None:
 def test_if_complete_tests() -> None:
     """Checks whether the parametrize test_autodetect_asset are complete (see tests/release_jsons)."""
     # Get all test files in tests/release_jsons
-    test_files_dir = Path(__file__).parent / "release_jsons"
-    test_files = list(test_files_dir.glob("*.json"))
+    test_files = list(RELEASE_JSONS_DIR.glob("*.json"))
 
     # Extract tool names from JSON files (excluding *_releases.json which are for tag_pattern tests)
     json_tool_names = {file.stem for file in test_files if not file.stem.endswith("_releases")}
@@ -1,5 +1,7 @@
 """Tests for the summary module."""
 
+import pytest
+
 from dotbins.summary import (
     FailedToolSummary,
     SkippedToolSummary,
@@ -148,4 +150,25 @@ def test_update_summary_add_methods() -> None:
     # Check has_entries
     assert summary.has_entries()
 
+
+def test_display_update_summary(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that display_update_summary prints a table for each kind of entry."""
+    summary = UpdateSummary()
+    summary.add_updated_tool(
+        tool="tool1",
+        platform="linux",
+        arch="amd64",
+        tag="v1.0.0",
+        old_tag="v0.9.0",
+    )
+    summary.add_skipped_tool(tool="tool2", platform="macos", arch="arm64", tag="v1.0.0")
+    summary.add_failed_tool(tool="tool3", platform="linux", arch="arm64", reason="Download failed")
+
     display_update_summary(summary)
+
+    out = capsys.readouterr().out
+    assert "Update Summary" in out
+    assert "Skipped Tools" in out
+    assert "Updated Tools" in out
+    assert "Failed Updates" in out
+    assert "Download failed" in out
@@ -14,9 +14,11 @@ import pytest
 import dotbins
 from dotbins.config import BinSpec, Config, RawToolConfigDict, _find_config_file, build_tool_config
 from dotbins.manifest import Manifest
+from dotbins.summary import UpdateSummary
 from dotbins.utils import replace_home_in_path
 
 if TYPE_CHECKING:
+    import requests
     from requests_mock import Mocker
 
 
@@ -128,6 +130,29 @@ def test_download_file(requests_mock: Mocker, tmp_path: Path) -> None:
         assert f.read() == test_content
 
 
+def test_download_file_with_session(
+    requests_mock: Mocker,
+    tmp_path: Path,
+    http_session: requests.Session,
+) -> None:
+    """Test downloading a file through a session passed in by the caller."""
+    url = "https://example.com/test.tar.gz"
+    requests_mock.get(url, content=b"test file content")
+
+    dest_path = str(tmp_path / "downloaded.tar.gz")
+    with patch.object(http_session, "get", wraps=http_session.get) as mock_get:
+        dotbins.download.download_file(
+            url,
+            dest_path,
+            github_token=None,
+            verbose=True,
+            session=http_session,
+        )
+
+    mock_get.assert_called_once()
+    assert Path(dest_path).read_bytes() == b"test file content"
+
+
 def test_extract_from_archive_tar(tmp_path: Path, create_dummy_archive: Callable) -> None:
     """Test extracting binary from tar.gz archive."""
     # Create a test tarball using the fixture
@@ -615,6 +640,53 @@ def test_extract_from_archive_with_arch_platform_version_in_path(
     assert _is_executable_or_file(extracted_bin)
 
 
+def test_process_downloaded_files_records_in_task_order(tmp_path: Path) -> None:
+    """Test that processed downloads are recorded in task order, not completion order."""
+    download_tasks = []
+    for name in ["zeta", "alpha", "mid", "beta"]:
+        tool_config = build_tool_config(
+            tool_name=name,
+            raw_data={"repo": f"test/{name}", "extract_archive": False},
+        )
+        temp_path = tmp_path / "downloads" / name
+        temp_path.parent.mkdir(exist_ok=True)
+        temp_path.write_text(f"#!/bin/sh\necho {name}")
+        download_tasks.append(
+            dotbins.download._DownloadTask(
+                bin_spec=BinSpec(
+                    tool_config=tool_config,
+                    tag="v1.0.0",
+                    arch="amd64",
+                    platform="linux",
+                ),
+                asset_url=f"https://example.com/{name}",
+                asset_name=name,
+                destination_dir=tmp_path / "linux" / "amd64" / "bin",
+                temp_path=temp_path,
+            ),
+        )
+
+    manifest = Manifest(tmp_path)
+    summary = UpdateSummary()
+    dotbins.download.process_downloaded_files(
+        download_tasks,
+        [True, False, True, True],
+        manifest,
+        summary,
+        verbose=False,
+    )
+
+    assert [t.tool for t in summary.updated] == ["zeta", "mid", "beta"]
+    assert [(t.tool, t.reason) for t in summary.failed] == [("alpha", "Download failed")]
+    assert list(manifest.data) == [
+        "version",
+        "zeta/linux/amd64",
+        "mid/linux/amd64",
+        "beta/linux/amd64",
+    ]
+    assert manifest.get_tool_info("zeta", "linux", "amd64")["sha256"]  # type: ignore[index]
+
+
 def test_find_config_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
     """Test finding configuration file covers all code paths."""
     # Case 1: Explicit path that exists
@@ -6,6 +6,7 @@ import lzma
 import os
 import tarfile
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import patch
@@ -18,6 +19,7 @@ from dotbins.utils import (
     extract_archive,
     fetch_release_info,
     github_url_to_raw_url,
+    http_session,
     humanize_time_ago,
     tag_to_version,
 )
@@ -264,6 +266,14 @@ def test_tag_to_version() -> None:
     assert tag_to_version("v-invalid") == "v-invalid"
 
 
+def test_http_session_is_per_thread() -> None:
+    """Test that a thread reuses its session but never shares it with another thread."""
+    assert http_session() is http_session()
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        other = ex.submit(http_session).result()
+    assert other is not http_session()
+
+
 class TestFetchReleaseInfoTagPattern:
     """Tests for fetch_release_info with tag_pattern parameter."""
 
@@ -279,7 +289,7 @@ class TestFetchReleaseInfoTagPattern:
             {"tag_name": "browser-v2025.12.1", "assets": []},
         ]
 
-        with patch("dotbins.utils.requests.get") as mock_get:
+        with patch("dotbins.utils.requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = mock_releases
             mock_get.return_value.raise_for_status = lambda: None
 
@@ -297,7 +307,7 @@ class TestFetchReleaseInfoTagPattern:
             {"tag_name": "desktop-v2025.12.1", "assets": []},
         ]
 
-        with patch("dotbins.utils.requests.get") as mock_get:
+        with patch("dotbins.utils.requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = mock_releases
             mock_get.return_value.raise_for_status = lambda: None
 
@@ -314,7 +324,7 @@ class TestFetchReleaseInfoTagPattern:
             {"tag_name": "v0.9.0", "assets": []},
         ]
 
-        with patch("dotbins.utils.requests.get") as mock_get:
+        with patch("dotbins.utils.requests.Session.get") as mock_get:
             mock_get.return_value.json.return_value = mock_releases
             mock_get.return_value.raise_for_status = lambda: None
 
@@ -326,7 +336,7 @@ class TestFetchReleaseInfoTagPattern:
         """Test that network errors are wrapped in RuntimeError."""
         fetch_release_info.cache_clear()
 
-        with patch("dotbins.utils.requests.get") as mock_get:
+        with patch("dotbins.utils.requests.Session.get") as mock_get:
             mock_get.side_effect = requests.RequestException("Connection failed")
 
             with pytest.raises(RuntimeError, match="Failed to fetch releases"):
@@ -446,7 +456,7 @@ class TestGitHubApiRateLimiting:
         )()
 
         with (
-            patch("dotbins.utils.requests.get") as mock_get,
+            patch("dotbins.utils.requests.Session.get") as mock_get,
             patch("dotbins.utils.time.sleep") as mock_sleep,
         ):
             mock_get.side_effect = [rate_limited_response, success_response]
@@ -457,6 +467,68 @@ class TestGitHubApiRateLimiting:
             assert mock_sleep.called
             assert mock_get.call_count == 2
 
+    def test_secondary_rate_limit_honors_retry_after(self) -> None:
+        """Test that a 429 waits for the Retry-After header before retrying."""
+        secondary_limited_response = type(
+            "Response",
+            (),
+            {
+                "status_code": 429,
+                "text": "You have exceeded a secondary rate limit",
+                "headers": {"Retry-After": "7"},
+            },
+        )()
+
+        success_response = type(
+            "Response",
+            (),
+            {"status_code": 200, "text": "OK", "headers": {}},
+        )()
+
+        with (
+            patch("dotbins.utils.requests.Session.get") as mock_get,
+            patch("dotbins.utils.time.sleep") as mock_sleep,
+        ):
+            mock_get.side_effect = [secondary_limited_response, success_response]
+
+            result = _github_api_get("https://api.github.com/test", {})
+
+            assert result.status_code == 200
+            mock_sleep.assert_called_once_with(7.0)
+
+    def test_retry_after_http_date_falls_back_to_reset(self) -> None:
+        """Test that an HTTP-date Retry-After falls back to the X-RateLimit-Reset header."""
+        secondary_limited_response = type(
+            "Response",
+            (),
+            {
+                "status_code": 429,
+                "text": "You have exceeded a secondary rate limit",
+                "headers": {
+                    "Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT",
+                    "X-RateLimit-Reset": "1000",
+                },
+            },
+        )()
+
+        success_response = type(
+            "Response",
+            (),
+            {"status_code": 200, "text": "OK", "headers": {}},
+        )()
+
+        with (
+            patch("dotbins.utils.requests.Session.get") as mock_get,
+            patch("dotbins.utils.time.sleep") as mock_sleep,
+            patch("dotbins.utils.time.time", return_value=995),
+        ):
+            mock_get.side_effect = [secondary_limited_response, success_response]
+
+            result = _github_api_get("https://api.github.com/test", {})
+
+            assert result.status_code == 200
+            mock_sleep.assert_called_once_with(6)
+
     def test_non_rate_limit_403_not_retried(self) -> None:
         """Test that non-rate-limit 403 errors are not retried."""
         response = type(
@@ -465,7 +537,7 @@ class TestGitHubApiRateLimiting:
             {"status_code": 403, "text": "Forbidden - bad credentials", "headers": {}},
         )()
 
-        with patch("dotbins.utils.requests.get", return_value=response):
+        with patch("dotbins.utils.requests.Session.get", return_value=response):
             result = _github_api_get("https://api.github.com/test", {})
             assert result.status_code == 403
 
@@ -478,7 +550,7 @@ class TestGitHubApiRateLimiting:
         )()
 
         with (
-            patch("dotbins.utils.requests.get", return_value=response),
+            patch("dotbins.utils.requests.Session.get", return_value=response),
             patch("dotbins.utils.time.sleep") as mock_sleep,
         ):
             result = _github_api_get("https://api.github.com/test", {})
@@ -501,7 +573,7 @@ class TestGitHubApiRateLimiting:
         )()
 
         with (
-            patch("dotbins.utils.requests.get", return_value=rate_limited_response),
+            patch("dotbins.utils.requests.Session.get", return_value=rate_limited_response),
             patch("dotbins.utils.time.sleep"),
         ):
             result = _github_api_get("https://api.github.com/test", {})